@@ -3,7 +3,7 @@ from datetime import timedelta
 from flask import Flask
 
 # Import our configuration logic
-from .config import init_firebase, FIREBASE_WEB_API_KEY
+from .config import init_firebase, FIREBASE_WEB_API_KEY, REDIS_URL
 
 def create_app():
     app = Flask(__name__)
@@ -15,6 +15,20 @@ def create_app():
     app.config['SESSION_COOKIE_SAMESITE'] = 'None'
     app.config['SESSION_COOKIE_SECURE'] = True
 
+    # Server-side sessions: with Redis the cookie only carries a session id instead of the signed payload.
+    # Optional: needs `pip install Flask-Session redis` on top of requirements.txt
+    if REDIS_URL:
+        try:
+            import redis
+            from flask_session import Session
+            app.config['SESSION_TYPE'] = 'redis'
+            # Flask-Session defaults to permanent sessions; only login opts in via session.permanent
+            app.config['SESSION_PERMANENT'] = False
+            app.config['SESSION_REDIS'] = redis.from_url(REDIS_URL)
+            Session(app)
+        except ImportError:
+            print("⚠️ REDIS_URL set but Flask-Session/redis not installed - using cookie sessions")
+
     # Initialize Database
     try:
         init_firebase()
@@ -1,11 +1,22 @@
 import functools
 import requests
+from requests.adapters import HTTPAdapter
 from flask import Blueprint, render_template, request, redirect, url_for, session, flash
 
 from ..config import FIREBASE_WEB_API_KEY
 
 auth_bp = Blueprint('auth', __name__)
 
+# Identity Toolkit endpoints only depend on the API key, so build them once
+_LOGIN_URL = f"https://identitytoolkit.googleapis.com/v1/accounts:signInWithPassword?key={FIREBASE_WEB_API_KEY}"
+_SIGNUP_URL = f"https://identitytoolkit.googleapis.com/v1/accounts:signUp?key={FIREBASE_WEB_API_KEY}"
+_RESET_URL = f"https://identitytoolkit.googleapis.com/v1/accounts:sendOobCode?key={FIREBASE_WEB_API_KEY}"
+
+# Keep-alive session so logins reuse the TLS connection to Google Identity Toolkit
+FIREBASE_TIMEOUT = (3, 10)
+_FIREBASE_SESSION = requests.Session()
+_FIREBASE_SESSION.mount("https://", HTTPAdapter(pool_connections=10, pool_maxsize=20))
+
 # --- Helper Decorator ---
 def login_required(f):
     @functools.wraps(f)
@@ -25,8 +36,10 @@ def login():
         
         if FIREBASE_WEB_API_KEY:
             # Exchange password for auth token via Google Identity Toolkit
-            url = f"https://identitytoolkit.googleapis.com/v1/accounts:signInWithPassword?key={FIREBASE_WEB_API_KEY}"
-            resp = requests.post(url, json={"email": email, "password": password, "returnSecureToken": True})
+            try:
+                resp = _FIREBASE_SESSION.post(_LOGIN_URL, json={"email": email, "password": password, "returnSecureToken": True}, timeout=FIREBASE_TIMEOUT)
+            except requests.RequestException:
+                return render_template("auth/login.html", mode="login", error="Authentication service unavailable, please try again")
             if resp.status_code == 200:
                 session.permanent = True
                 session['user_id'] = resp.json()['localId']
@@ -45,8 +58,10 @@ def register():
         password = request.form.get("password")
         
         if FIREBASE_WEB_API_KEY:
-            url = f"https://identitytoolkit.googleapis.com/v1/accounts:signUp?key={FIREBASE_WEB_API_KEY}"
-            resp = requests.post(url, json={"email": email, "password": password, "returnSecureToken": True})
+            try:
+                resp = _FIREBASE_SESSION.post(_SIGNUP_URL, json={"email": email, "password": password, "returnSecureToken": True}, timeout=FIREBASE_TIMEOUT)
+            except requests.RequestException:
+                return render_template("auth/register.html", mode="register", error="Authentication service unavailable, please try again")
             if resp.status_code == 200:
                 session['user_id'] = resp.json()['localId']
                 flash("Registration Successful! Welcome to the Toolkit.", "success")
@@ -63,8 +78,10 @@ def reset_password():
     if request.method == "POST":
         email = request.form.get("email")
         if FIREBASE_WEB_API_KEY:
-            url = f"https://identitytoolkit.googleapis.com/v1/accounts:sendOobCode?key={FIREBASE_WEB_API_KEY}"
-            resp = requests.post(url, json={"requestType": "PASSWORD_RESET", "email": email})
+            try:
+                resp = _FIREBASE_SESSION.post(_RESET_URL, json={"requestType": "PASSWORD_RESET", "email": email}, timeout=FIREBASE_TIMEOUT)
+            except requests.RequestException:
+                return render_template("auth/reset.html", mode="reset", error="Authentication service unavailable, please try again")
             if resp.status_code == 200:
                 return render_template("auth/reset.html", mode="reset", success="Password reset email sent!")
             else:
@@ -1,4 +1,6 @@
 import threading
+from collections import deque
+from itertools import islice
 from flask import Blueprint, jsonify, session, request, redirect, url_for, render_template
 from markupsafe import escape
 from werkzeug.utils import secure_filename
@@ -6,7 +8,7 @@ from werkzeug.utils import secure_filename
 # Import Logic Services
 from ..services.spot_engine import spot_volume_tracker
 from ..services.analysis import crypto_analysis_v4
-from ..state import LOCK, USER_LOGS, USER_PROGRESS, update_progress, get_user_temp_dir, get_progress
+from ..state import MAX_LOG_LINES, USER_LOGS, USER_PROGRESS, user_lock, update_progress, get_user_temp_dir, get_progress
 from ..config import get_user_keys, increment_global_stat
 from .auth import login_required
 
@@ -17,8 +19,8 @@ def run_background_task(target_func, user_id):
     """
     Executes analysis in a thread named after the user_id.
     """
-    with LOCK:
-        USER_LOGS[user_id] = []
+    with user_lock(user_id):
+        USER_LOGS[user_id] = deque(maxlen=MAX_LOG_LINES)
         USER_PROGRESS[user_id] = {"percent": 5, "text": "Initializing Engine...", "status": "active"}
 
     def worker():
@@ -74,14 +76,14 @@ def logs_chunk():
     except:
         last_idx = 0
     
-    with LOCK:
-        logs = USER_LOGS.get(uid, [])
+    with user_lock(uid):
+        logs = USER_LOGS.get(uid, ())
         current_len = len(logs)
         if last_idx > current_len:
-            new_logs = logs
+            new_logs = list(logs)
             current_len = len(logs)
         else:
-            new_logs = [] if last_idx >= current_len else logs[last_idx:]
+            new_logs = [] if last_idx >= current_len else list(islice(logs, last_idx, None))
             
     return jsonify({"logs": new_logs, "last_index": current_len})
 
@@ -23,6 +23,7 @@ STABLECOINS = {
 }
 
 FIREBASE_WEB_API_KEY = os.environ.get("FIREBASE_API_KEY")
+REDIS_URL = os.environ.get("REDIS_URL")
 
 # --- Database Initialization ---
 db = None # Global DB object
@@ -1,6 +1,6 @@
-import re
 import datetime
 import pandas as pd
+from lxml import html as lxml_html
 from typing import List, Optional, Tuple
 from pathlib import Path
 
@@ -75,12 +75,25 @@ class FileScanner:
 class DataProcessor:
     """Handles Dataframe loading, merging, and HTML generation."""
     
+    @staticmethod
+    def _read_html_table(path: Path) -> pd.DataFrame:
+        """Reads the first table of an HTML file straight from lxml, skipping pandas' read_html inference."""
+        tables = lxml_html.parse(str(path)).xpath('//table')
+        rows = [[cell.text_content().strip() for cell in tr.xpath('./th|./td')] for tr in tables[0].xpath('.//tr')] if tables else []
+        if not rows:
+            raise ValueError("No tables found")
+        header, body = rows[0], rows[1:]
+        width = len(header)
+        # Empty and missing cells become NaN, as read_html gave, so numeric filters skip them
+        nan = float('nan')
+        return pd.DataFrame([([c or nan for c in r] + [nan] * width)[:width] for r in body], columns=header)
+
     @staticmethod
     def load_spot(path: Path) -> pd.DataFrame:
         print(f"   Parsing Spot File: {path.name}")
         try:
             if path.suffix == '.html':
-                df = pd.read_html(path)[0]
+                df = DataProcessor._read_html_table(path)
             else:
                 df = pd.read_csv(path)
             df.columns = [c.lower().replace(' ', '_') for c in df.columns]
@@ -106,24 +119,37 @@ class DataProcessor:
                         break
 
             if 'ticker' in df.columns:
-                df['ticker'] = df['ticker'].apply(lambda x: re.sub(r'[^A-Z0-9]', '', str(x).upper()))
+                df['ticker'] = df['ticker'].astype(str).str.upper().str.replace(r'[^A-Z0-9]', '', regex=True)
             print(f"   Extracted {len(df)} spot tokens")
             return df
         except Exception as e:
             print(f"   Spot File Error: {e}")
             return pd.DataFrame()
 
+    @staticmethod
+    def _format_cells(col: pd.Series) -> List[str]:
+        """Formats one column's cells as DataFrame.to_html does, without its per-cell HTML writer."""
+        values = col.tolist()
+        if all(isinstance(v, str) for v in values):
+            return [v.strip() for v in values]
+        # Numbers and missing values go through pandas' own column formatter, so floats keep
+        # their column-wide precision and notation, and NaN/None/<NA> read as before
+        return [s.strip() for s in col.to_string(index=False).split("\n")]
+
     @staticmethod
     def _generate_table_html(title: str, df: pd.DataFrame, headers: List[str], df_cols: List[str]) -> str:
         if df.empty:
             return f'<div class="table-container"><h2>{title}</h2><p>No data found</p></div>'
-        missing = [c for c in df_cols if c not in df.columns]
-        df_display = df.copy()
-        for m in missing:
-            df_display[m] = ""
-        df_display = df_display[df_cols]
-        df_display.columns = headers
-        table_html = df_display.to_html(index=False, classes='table', escape=False)
+        # Rows are joined directly instead of via DataFrame.to_html; cells hold pre-built HTML, so no escaping
+        df_display = df.reindex(columns=df_cols, fill_value="")
+        header_html = "".join(f"<th>{h}</th>" for h in headers)
+        cells = [DataProcessor._format_cells(df_display.iloc[:, i]) for i in range(len(df_cols))]
+        rows_html = "".join("<tr>" + "".join(f"<td>{v}</td>" for v in row) + "</tr>" for row in zip(*cells))
+        table_html = (
+            '<table border="1" class="dataframe table">'
+            f'<thead><tr style="text-align: right;">{header_html}</tr></thead>'
+            f'<tbody>{rows_html}</tbody></table>'
+        )
         return f'<div class="table-container"><h2>{title}</h2>{table_html}</div>'
 
     @staticmethod
@@ -145,6 +171,11 @@ class DataProcessor:
             valid_futures['vtmr_display'] = valid_futures['vtmr']
 
         # Create the 3 main datasets: Overlap, Futures-Only, Spot-Only
+        # Duplicate tickers are only reported; the merge itself runs once, unvalidated
+        dupes = pd.concat([spot_df.loc[spot_df['ticker'].duplicated(), 'ticker'],
+                           valid_futures.loc[valid_futures['ticker'].duplicated(), 'ticker']]).unique()
+        if len(dupes):
+            print(f"   Duplicate tickers in source data: {', '.join(map(str, dupes))}")
         merged = pd.merge(spot_df, valid_futures, on='ticker', how='inner', suffixes=('_spot', '_fut'))
         if 'vtmr' in merged.columns:
             merged = merged.sort_values('vtmr', ascending=False)
@@ -1,14 +1,22 @@
 import re
 import pandas as pd
-from dataclasses import dataclass
-from typing import List, Optional, Tuple
+from bisect import bisect_right
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from itertools import accumulate
+from dataclasses import dataclass, fields
+from typing import Dict, Iterator, Optional, Tuple
 
 try:
     import pypdf
 except Exception:
     pypdf = None
 
-@dataclass
+_TICKER_RE = re.compile(r'[^A-Z0-9]')
+# Every byte except A-Z and 0-9, for stripping tickers with bytes.translate
+_TICKER_DELETE = bytes(b for b in range(256) if not (48 <= b <= 57 or 65 <= b <= 90))
+
+@dataclass(slots=True, frozen=True)
 class TokenData:
     ticker: str
     name: str
@@ -21,12 +29,16 @@ class TokenData:
 class PDFParser:
     """Handles extraction of tabular data from Coinalyze PDFs using regex."""
     
+    # Market cap, volume, optional OI change and funding rate, then VTMR.
+    # Separators exclude newlines so a sweep over the whole page never matches across lines.
+    # The lookbehind only lets a match start at the head of a numeric run and the VTMR group
+    # never backtracks, so garbage lines full of digits fail in linear time.
     FINANCIAL_PATTERN = re.compile(
-        r'(\$?[+-]?[\d,\.]+[kKmMbB]?)\s+'             
-        r'(\$?[+-]?[\d,\.]+[kKmMbB]?)\s+'             
-        r'(?:([+\-]?[\d\.\,]+\%?|[\-\–\—]|N\/A)\s+)?' 
-        r'(?:([+\-]?[\d\.\,]+\%?|[\-\–\—]|N\/A)\s+)?' 
-        r'(\d*\.?\d+)'                                
+        r'(\$?[+-]?(?<![\d,\.])[\d,\.]+[kKmMbB]?)[^\S\n]+'
+        r'(\$?[+-]?[\d,\.]+[kKmMbB]?)[^\S\n]+'
+        r'(?:([+\-]?[\d\.\,]+\%?|[\-\–\—]|N\/A)[^\S\n]+)?'
+        r'(?:([+\-]?[\d\.\,]+\%?|[\-\–\—]|N\/A)[^\S\n]+)?'
+        r'(\d+(?:\.\d+)?|\.\d+)'
     )
 
     IGNORE_KEYWORDS = {
@@ -34,6 +46,10 @@ class PDFParser:
         'mkt cap', 'vol 24h', 'vtmr', 'coins', 'all contracts', 'custom metrics', 'watchlists'
     }
 
+    # Single case-insensitive alternation so each line is scanned once, without a .lower() copy.
+    # ASCII-only folding, so e.g. 'ſ' never matches 's' (the keywords are all ASCII)
+    IGNORE_PATTERN = re.compile('|'.join(map(re.escape, sorted(IGNORE_KEYWORDS))), re.IGNORECASE | re.ASCII)
+
     # --- Signal Helpers (Moved inside to keep logic self-contained) ---
 
     @staticmethod
@@ -93,19 +109,17 @@ class PDFParser:
         if pypdf is None:
             print("   pypdf not available - PDF parsing disabled.")
             return pd.DataFrame()
-        data: List[TokenData] = []
+        # Parsed rows are appended column-wise and turned into a DataFrame in one go
+        columns: Dict[str, list] = {f.name: [] for f in fields(TokenData)}
         try:
-            reader = pypdf.PdfReader(path)
-            for page in reader.pages:
-                raw = page.extract_text() or ""
-                lines = [ln.strip() for ln in raw.split("\n") if ln.strip()]
-                page_data = cls._parse_page_smart(lines)
-                data.extend(page_data)
-            print(f"   Extracted {len(data)} futures tokens")
-            if not data:
+            for text in cls._iter_page_texts(path):
+                cls._parse_page_smart(text, columns)
+            total = len(columns['ticker'])
+            print(f"   Extracted {total} futures tokens")
+            if not total:
                 return pd.DataFrame()
-            df = pd.DataFrame([vars(t) for t in data])
-            df['ticker'] = df['ticker'].apply(lambda x: re.sub(r'[^A-Z0-9]', '', str(x).upper()))
+            df = pd.DataFrame(columns)
+            df['ticker'] = df['ticker'].astype(str).str.upper().str.replace(_TICKER_RE, '', regex=True)
             df = df[df['ticker'].str.len() > 1]
             print(f"   Valid futures tokens: {len(df)}")
             return df
@@ -113,30 +127,65 @@ class PDFParser:
             print(f"   PDF Error: {e}")
             return pd.DataFrame()
 
+    @staticmethod
+    def _pypdf_page_texts(path) -> Iterator[str]:
+        reader = pypdf.PdfReader(path)
+        for page in reader.pages:
+            yield page.extract_text() or ""
+
     @classmethod
-    def _parse_page_smart(cls, lines: List[str]) -> List[TokenData]:
+    def _iter_page_texts(cls, path, prefetch: int = 4) -> Iterator[str]:
+        """
+        Yields page texts in order while a single background worker extracts up to
+        `prefetch` pages ahead. The whole document lifecycle runs on that one worker,
+        since pypdf reads every page through one shared file stream.
+        """
+        pages = cls._pypdf_page_texts(path)
+        with ThreadPoolExecutor(max_workers=1) as ex:
+            try:
+                pending = deque(ex.submit(next, pages, None) for _ in range(prefetch))
+                while (text := pending.popleft().result()) is not None:
+                    pending.append(ex.submit(next, pages, None))
+                    yield text
+            finally:
+                ex.submit(pages.close)
+
+    @classmethod
+    def _parse_page_smart(cls, text: str, columns: Dict[str, list]) -> None:
         financials = []
         raw_text_lines = []
+
+        # Sweep the whole page once per pattern: first financial match and any ignore keyword per line
+        raw_lines = text.split("\n")
+        line_starts = list(accumulate((len(ln) + 1 for ln in raw_lines[:-1]), initial=0))
+        line_of = lambda m: bisect_right(line_starts, m.start()) - 1
+        line_matches = {}
+        for m in cls.FINANCIAL_PATTERN.finditer(text):
+            line_matches.setdefault(line_of(m), m)
+        # Every row needs a financial line, so pages without one (covers, legends) yield nothing
+        if not line_matches:
+            return
+        ignored = {line_of(m) for m in cls.IGNORE_PATTERN.finditer(text)}
         
-        for line in lines:
-            if any(k in line.lower() for k in cls.IGNORE_KEYWORDS):
+        for idx, raw_line in enumerate(raw_lines):
+            if idx in ignored:
                 continue
             
-            fin_match = cls.FINANCIAL_PATTERN.search(line)
+            fin_match = line_matches.get(idx)
             if fin_match:
                 groups = fin_match.groups()
                 mc = groups[0].replace('$', '').replace(',', '')
                 vol = groups[1].replace('$', '').replace(',', '')
                 oi_str = groups[2]
                 fund_str = groups[3]
-                vtmr = groups[4]
                 try:
-                    float(vtmr)
+                    vtmr = float(groups[4])
                     financials.append((mc, vol, vtmr, oi_str, fund_str))
                 except:
-                    raw_text_lines.append(line)
+                    raw_text_lines.append(raw_line.strip())
             else:
-                if not line.isdigit() and len(line) > 1:
+                line = raw_line.strip()
+                if len(line) > 1 and not line.isdigit():
                     raw_text_lines.append(line)
         
         token_pairs = []
@@ -166,7 +215,6 @@ class PDFParser:
             else:
                 i += 1
         
-        tokens: List[TokenData] = []
         limit = min(len(token_pairs), len(financials))
         
         for k in range(limit):
@@ -176,20 +224,17 @@ class PDFParser:
             oiss_val = cls.make_oiss(oi_pct) if oi_pct and oi_pct not in ['-', 'N/A'] else "-"
             funding_val = cls.make_funding_signal(fund_pct)
 
-            tokens.append(TokenData(
-                ticker=ticker,
-                name=name,
-                market_cap=mc,
-                volume=vol,
-                vtmr=float(vtmr),
-                funding=funding_val,
-                oiss=oiss_val
-            ))
-        return tokens
+            columns['ticker'].append(ticker)
+            columns['name'].append(name)
+            columns['market_cap'].append(mc)
+            columns['volume'].append(vol)
+            columns['vtmr'].append(vtmr)
+            columns['funding'].append(funding_val)
+            columns['oiss'].append(oiss_val)
 
     @staticmethod
     def _clean_ticker_strict(text: str) -> Optional[str]:
         if len(text) > 15: return None
-        cleaned = re.sub(r'[^A-Z0-9]', '', text.upper())
-        if 2 <= len(cleaned) <= 12: return cleaned
+        cleaned = text.upper().encode('ascii', 'ignore').translate(None, _TICKER_DELETE)
+        if 2 <= len(cleaned) <= 12: return cleaned.decode('ascii')
         return None
\ No newline at end of file
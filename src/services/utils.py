@@ -12,8 +12,9 @@ from ..state import get_user_temp_dir
 
 # --- Shared Utilities ---
 
-def create_session(retries: int = 3, backoff_factor: float = 0.5, status_forcelist=(429, 500, 502, 503, 504)) -> requests.Session:
-    """Configures a requests session with automatic retry logic for resilience."""
+def create_session(retries: int = 3, backoff_factor: float = 0.5, status_forcelist=(429, 500, 502, 503, 504),
+                   pool_connections: int = 10, pool_maxsize: int = 20) -> requests.Session:
+    """Configures a keep-alive requests session with a sized connection pool and automatic retry logic."""
     session = requests.Session()
     retry = Retry(
         total=retries,
@@ -21,7 +22,8 @@ def create_session(retries: int = 3, backoff_factor: float = 0.5, status_forceli
         status_forcelist=status_forcelist,
         allowed_methods=frozenset(["GET", "POST", "PUT", "DELETE", "HEAD", "OPTIONS"])
     )
-    adapter = HTTPAdapter(max_retries=retry)
+    # Shared by every user's fetcher threads, so keep enough pooled connections alive to avoid re-handshakes
+    adapter = HTTPAdapter(max_retries=retry, pool_connections=pool_connections, pool_maxsize=pool_maxsize)
     session.mount("https://", adapter)
     session.mount("http://", adapter)
     return session
@@ -67,8 +69,8 @@ def convert_html_to_pdf(html_content: str, user_id: str) -> Optional[Path]:
             page = browser.new_page()
             
             # 2. Load HTML
-            # wait_until="networkidle" is safer to ensure styles load
-            page.set_content(html_content, wait_until="networkidle")
+            # Styles are inlined, so "load" is enough; "networkidle" only adds an idle-network wait
+            page.set_content(html_content, wait_until="load")
             
             # 3. Print to PDF (US Letter, No Auto-Scaling)
             page.pdf(
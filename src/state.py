@@ -1,24 +1,36 @@
+import re
 import threading
 import sys
+from collections import deque
 from pathlib import Path
 import datetime
 
 # --- Global State ---
 USER_LOGS = {} 
 USER_PROGRESS = {}
-LOCK = threading.Lock()
+USER_LOCKS = {}
+LOCK = threading.Lock()  # Only guards creation of entries in USER_LOCKS
+MAX_LOG_LINES = 500
 
 # --- Configuration Constants ---
 TEMP_DIR = Path("/tmp")
 TEMP_DIR.mkdir(parents=True, exist_ok=True)
 
 # --- Helper Functions for State ---
+def user_lock(uid) -> threading.Lock:
+    """Returns the lock guarding one user's logs and progress, so users never contend with each other."""
+    lock = USER_LOCKS.get(uid)
+    if lock is None:
+        with LOCK:
+            lock = USER_LOCKS.setdefault(uid, threading.Lock())
+    return lock
+
 def get_progress(uid):
-    with LOCK:
+    with user_lock(uid):
         return USER_PROGRESS.get(uid, {"percent": 0, "text": "System Idle", "status": "idle"})
 
 def update_progress(uid, percent, text, status):
-    with LOCK:
+    with user_lock(uid):
         USER_PROGRESS[uid] = {"percent": percent, "text": text, "status": status}
 
 def get_user_temp_dir(uid) -> Path:
@@ -28,6 +40,21 @@ def get_user_temp_dir(uid) -> Path:
     return user_dir
 
 # --- Log Capture System ---
+# Log keywords that drive the progress bar, in priority order
+PROGRESS_STAGES = {
+    "scanning coingecko": (10, "Fetching CoinGecko Data...", "active"),
+    "scanning livecoinwatch": (30, "Fetching LiveCoinWatch...", "active"),
+    "parsing spot file": (50, "Analyzing Spot Volumes...", "active"),
+    "parsing futures pdf": (70, "Parsing Futures PDF...", "active"),
+    "converting to pdf": (90, "Compiling Report...", "active"),
+    "completed": (100, "Task Completed Successfully", "success"),
+    "pdf saved": (100, "Task Completed Successfully", "success"),
+    "error": (0, "Error Occurred", "error"),
+}
+_STAGE_PRIORITY = {keyword: i for i, keyword in enumerate(PROGRESS_STAGES)}
+# ASCII-only case folding, so every hit lower-cases back to a PROGRESS_STAGES key (e.g. 'ſ' never matches 's')
+_PROGRESS_RE = re.compile('|'.join(map(re.escape, PROGRESS_STAGES)), re.IGNORECASE | re.ASCII)
+
 class LogCatcher:
     """
     Redirects stdout. Detects which user triggered the log based on 
@@ -46,30 +73,15 @@ class LogCatcher:
             if thread_name.startswith("user_"):
                 uid = thread_name.replace("user_", "")
                 
-                with LOCK:
-                    if uid not in USER_LOGS:
-                        USER_LOGS[uid] = []
-                    
-                    USER_LOGS[uid].append(msg)
-                    if len(USER_LOGS[uid]) > 500:
-                        USER_LOGS[uid].pop(0)
+                with user_lock(uid):
+                    # Bounded deque drops the oldest line in O(1) once full
+                    USER_LOGS.setdefault(uid, deque(maxlen=MAX_LOG_LINES)).append(msg)
                 
-                # Update progress bars based on keywords
-                text = msg.lower()
-                if "scanning coingecko" in text:
-                    update_progress(uid, 10, "Fetching CoinGecko Data...", "active")
-                elif "scanning livecoinwatch" in text:
-                    update_progress(uid, 30, "Fetching LiveCoinWatch...", "active")
-                elif "parsing spot file" in text:
-                    update_progress(uid, 50, "Analyzing Spot Volumes...", "active")
-                elif "parsing futures pdf" in text:
-                    update_progress(uid, 70, "Parsing Futures PDF...", "active")
-                elif "converting to pdf" in text:
-                    update_progress(uid, 90, "Compiling Report...", "active")
-                elif "completed" in text or "pdf saved" in text:
-                    update_progress(uid, 100, "Task Completed Successfully", "success")
-                elif "error" in text:
-                    update_progress(uid, 0, "Error Occurred", "error")
+                # Update progress bars based on keywords (one scan; highest-priority keyword wins)
+                hits = _PROGRESS_RE.findall(msg)
+                if hits:
+                    stage = min((h.lower() for h in hits), key=_STAGE_PRIORITY.__getitem__)
+                    update_progress(uid, *PROGRESS_STAGES[stage])
 
     def flush(self):
         self.terminal.flush()
@@ -0,0 +1,35 @@
+import pandas as pd
+from lxml import html as lxml_html
+
+from src.services.analysis import DataProcessor
+
+SPOT_HEADER = ("<tr><th>Rank</th><th>Ticker</th><th>Market Cap</th><th>Volume 24h</th>"
+               "<th>Spot VTMR</th><th>Verifications</th><th>Large Cap</th></tr>")
+
+
+def _spot_row(rank, ticker, vtmr):
+    return (f"<tr><td>#{rank}</td><td><b>{ticker}</b></td><td>$1M</td><td>$2M</td>"
+            f"<td>{vtmr}</td><td>2</td><td>No</td></tr>")
+
+
+def test_load_spot_html_empty_cells_are_missing(tmp_path):
+    path = tmp_path / "Volumed_Spot_Tokens.html"
+    path.write_text(f"<html><body><table>{SPOT_HEADER}{_spot_row(1, 'doge', '')}{_spot_row(2, 'ADA', '2.0x')}</table></body></html>")
+    df = DataProcessor.load_spot(path)
+    assert list(df["ticker"]) == ["DOGE", "ADA"]
+    assert pd.isna(df["spot_flip"].iloc[0])
+    assert df["spot_flip"].iloc[1] == "2.0x"
+
+
+def test_report_formats_numeric_csv_cells_like_to_html(tmp_path):
+    path = tmp_path / "Volumed_Spot_Tokens.csv"
+    path.write_text("Ticker,Market Cap,Volume 24h,Spot VTMR\n"
+                    "BTC,1234567890.123,0.00000055,2.5\nADA,5000,,1.5\n")
+    futures = pd.DataFrame({"ticker": ["BTC"], "name": ["Bitcoin"], "market_cap": ["1.2B"], "volume": ["3B"],
+                            "vtmr": [2.5], "funding": ["-"], "oiss": ["-"]})
+    html = DataProcessor.generate_html_report(futures, DataProcessor.load_spot(path))
+    rows = [[td.text_content() for td in tr.xpath("./td")] for tr in lxml_html.fromstring(html).xpath("//tbody/tr")]
+    assert rows == [
+        ["BTC", "1.234568e+09", "5.500000e-07", "2.5", "3B", "2.5x", "-", "-"],
+        ["ADA", "5000.0", "NaN", "1.5"],
+    ]
@@ -0,0 +1,60 @@
+from pathlib import Path
+from dataclasses import fields
+
+import pytest
+
+from src.services.futures_engine import PDFParser, TokenData
+
+
+def _parse(text):
+    columns = {f.name: [] for f in fields(TokenData)}
+    PDFParser._parse_page_smart(text, columns)
+    return columns
+
+
+@pytest.mark.parametrize("line, groups", [
+    ("1.2B\xa03.4M 5% 2.5", ("1.2B", "3.4M", "5%", None, "2.5")),
+    ("$1.2B 3.4M　+5% 0.01% ２.5", ("$1.2B", "3.4M", "+5%", "0.01%", "２.5")),
+    ("$1.2B $30.5B\t-3% N/A 0.8", ("$1.2B", "$30.5B", "-3%", "N/A", "0.8")),
+])
+def test_financial_pattern_handles_unicode_whitespace_and_digits(line, groups):
+    assert PDFParser.FINANCIAL_PATTERN.search(line).groups() == groups
+
+
+def test_financial_pattern_does_not_cross_lines():
+    assert PDFParser.FINANCIAL_PATTERN.search("1.2B\n3.4M 2.5") is None
+
+
+def test_parse_page_pairs_names_tickers_and_financials_with_nbsp():
+    columns = _parse("Coinalyze Page 1\nBitcoin\nBTC\n$1.2B\xa0$30.5B\xa0+2.1%\xa00.01%\xa02.5\n")
+    assert columns["ticker"] == ["BTC"]
+    assert columns["name"] == ["Bitcoin"]
+    assert columns["market_cap"] == ["1.2B"]
+    assert columns["volume"] == ["30.5B"]
+    assert columns["vtmr"] == [2.5]
+
+
+FIXTURES = Path(__file__).parent / "fixtures"
+# (ticker, name, market cap, vtmr) rows drawn into both fixture PDFs
+EXPECTED_ROWS = [("BTC", "Bitcoin", "1.2B", 2.5), ("ETH", "Ethereum", "400M", 0.9), ("SOL", "Solana", "80M", 1.5)]
+
+
+def _rows(df):
+    if df.empty:
+        return []
+    return list(df[["ticker", "name", "market_cap", "vtmr"]].itertuples(index=False, name=None))
+
+
+def test_extract_row_layout_pdf():
+    assert _rows(PDFParser.extract(FIXTURES / "coinalyze_rows.pdf")) == EXPECTED_ROWS
+
+
+def test_extract_column_layout_pdf_never_mispairs_rows():
+    # Each cell is its own text item here; joining nearby items onto one line (as PDFium
+    # does) pairs ETHEREUM with Bitcoin's numbers, so nothing must be extracted
+    assert _rows(PDFParser.extract(FIXTURES / "coinalyze_columns.pdf")) == []
+
+
+@pytest.mark.parametrize("line, ignored", [("COINS", True), ("Mkt Cap", True), ("Coinſ", False), ("Bitcoin", False)])
+def test_ignore_pattern_folds_ascii_case_only(line, ignored):
+    assert bool(PDFParser.IGNORE_PATTERN.search(line)) is ignored